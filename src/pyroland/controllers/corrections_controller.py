@@ -24,6 +24,9 @@ from pathlib import Path
 from typing import Dict, Iterable, List
 
 import numpy as np
+from pyroland.corrections.correctors.response_corrector import (
+    CompositeResponseCorrector,
+)
 from pyroland.util.resources import data_path
 
 # --------------------------------------------------------------------------- #
@@ -134,6 +137,8 @@ class CorrectionsController:
         }
 
         self._enabled: Dict[str, bool] = {name: True for name in self._ORDER}
+        # Enabled correctors fused into one; rebuilt when the selection changes
+        self._composite: CompositeResponseCorrector | None = None
 
     # ------------------------------------------------------------------ #
     # Public API
@@ -152,7 +157,9 @@ class CorrectionsController:
         """Enable or disable a single correction by *name*."""
         if name not in self._enabled:
             raise KeyError(f"Unknown correction: {name!r}")
-        self._enabled[name] = bool(enabled)
+        if self._enabled[name] != bool(enabled):
+            self._enabled[name] = bool(enabled)
+            self._composite = None
 
     # -- Core functionality -------------------------------------------- #
     def apply(
@@ -167,10 +174,12 @@ class CorrectionsController:
         """
         corrected = counts.astype(float, copy=True)
 
-        for name in self._ORDER:
-            if self._enabled[name]:
-                corrector = self._correctors[name]
-                # Each corrector shares the same public API: ``correct(wl, counts)``
-                corrected = corrector.correct(wavelengths_nm, corrected)
+        if self._composite is None:
+            self._composite = CompositeResponseCorrector(
+                self._correctors[name] for name in self._ORDER if self._enabled[name]
+            )
+        # One combined inverse for all enabled corrections; ``corrected`` is
+        # our own copy, so it is overwritten in place
+        self._composite.correct(wavelengths_nm, corrected, out=corrected)
 
         return corrected
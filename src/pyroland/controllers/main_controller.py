@@ -2,23 +2,27 @@ from __future__ import annotations
 
 import os
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
-from PySide6.QtCore import QObject, QThread, Qt, Signal, Slot
+from PySide6.QtCore import QObject, QTimer, Qt, Signal, Slot
 from PySide6.QtGui import QDoubleValidator
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
+    QHeaderView,
     QListWidgetItem,
     QMessageBox,
     QPushButton,
     QLineEdit,
     QTableWidgetItem,
+    QWidget,
 )
 
-from sif_parser.utils import parse as sif_parse
+from sif_parser import np_open as sif_np_open
+from sif_parser.utils import extract_calibration, parse as sif_parse
 
 from pyroland.controllers.plot_controller import PlotController
 from pyroland.controllers.corrections_controller import CorrectionsController
@@ -29,13 +33,24 @@ from pyroland.controllers.corrections_info_controller import CorrectionsInfoCont
 __all__ = ["MainController"]
 
 # --------------------------------------------------------------------------- #
-#                               Worker Thread                                 #
+#                             Directory Watcher                               #
 # --------------------------------------------------------------------------- #
-class DirectoryWatcher(QThread):
-    """Poll *directory* for ``.sif`` files and emit a list whenever it changes."""
+class DirectoryWatcher(QObject):
+    """Poll *directory* for ``.sif`` files and emit a list whenever it changes.
+
+    Polling is driven by a :class:`QTimer` on the GUI event loop; each tick is
+    a single ``stat`` unless the directory contents may have changed.
+    """
 
     files_changed = Signal(list)  # list[Path]
 
+    # Coarsest directory-timestamp resolution we trust (FAT/exFAT: 2 s).  A
+    # scan made within this window of the directory mtime may have missed an
+    # entry added in the same timestamp tick, so the mtime proves nothing yet.
+    _MTIME_GRANULARITY_NS = 2_000_000_000
+    # Safety net (clock skew on network shares): full rescan every N ticks
+    _FULL_SCAN_EVERY = 10
+
     def __init__(
         self,
         directory: Path,
@@ -45,25 +60,84 @@ class DirectoryWatcher(QThread):
         super().__init__(parent)
         self._directory = directory
         self._interval = poll_interval
-        self._running = True
         self._known: set[Path] = set()
-
-    def run(self) -> None:
-        self._known = self._current_files()
+        # Directory mtime of the last scan; POSIX bumps it on every entry
+        # add/remove, so an unchanged value means the file set is unchanged –
+        # once the scan is clear of the timestamp granularity (see above).
+        self._dir_mtime_ns: Optional[int] = None
+        self._scan_started_ns = 0
+        self._ticks_since_scan = 0
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(self._interval * 1000))
+        self._timer.timeout.connect(self._tick)
+
+    def start(self) -> None:
+        self._known = self._scan(self._directory_mtime_ns())
         self.files_changed.emit(list(self._known))  # initial populate
-        while self._running:
-            time.sleep(self._interval)
-            now = self._current_files()
-            if now != self._known:
-                self._known = now
-                self.files_changed.emit(list(now))
+        self._timer.start()
 
     def stop(self) -> None:
-        self._running = False
-        self.wait()
+        self._timer.stop()
+
+    @Slot()
+    def _tick(self) -> None:
+        self._ticks_since_scan += 1
+        mtime_ns = self._directory_mtime_ns()
+        if (
+            mtime_ns is not None
+            and mtime_ns == self._dir_mtime_ns
+            and self._scan_started_ns - mtime_ns > self._MTIME_GRANULARITY_NS
+            and self._ticks_since_scan < self._FULL_SCAN_EVERY
+        ):
+            return  # nothing added or removed → skip the rescan
+        now = self._scan(mtime_ns)
+        if now != self._known:
+            self._known = now
+            self.files_changed.emit(list(now))
+
+    def _scan(self, mtime_ns: Optional[int]) -> set[Path]:
+        """List the directory, recording *mtime_ns* and when the scan began."""
+        self._dir_mtime_ns = mtime_ns
+        self._scan_started_ns = time.time_ns()
+        self._ticks_since_scan = 0
+        return self._current_files()
+
+    def _directory_mtime_ns(self) -> Optional[int]:
+        try:
+            return os.stat(self._directory).st_mtime_ns
+        except OSError:
+            return None
 
     def _current_files(self) -> set[Path]:
-        return {p for p in self._directory.glob("*.sif") if p.is_file()}
+        try:
+            with os.scandir(self._directory) as it:
+                return {
+                    Path(entry.path)
+                    for entry in it
+                    if entry.name.lower().endswith(".sif") and entry.is_file()
+                }
+        except OSError:
+            return set()
+
+
+# --------------------------------------------------------------------------- #
+#                               Widget helpers                                #
+# --------------------------------------------------------------------------- #
+@contextmanager
+def _bulk_update(widget: QWidget) -> Iterator[QWidget]:
+    """Suspend repaints and signals of *widget* while it is refilled.
+
+    The view is repainted once on exit instead of after every inserted item.
+    """
+    was_blocked = widget.blockSignals(True)
+    was_enabled = widget.updatesEnabled()
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(was_enabled)
+        widget.blockSignals(was_blocked)
 
 
 # --------------------------------------------------------------------------- #
@@ -92,6 +166,10 @@ class MainController(QObject):
         self._current_dir: Optional[Path] = None
         self._watcher: Optional[DirectoryWatcher] = None
         self._last_plot_path: Optional[Path] = None
+        # (path, st_mtime_ns) of the spectrum currently on screen
+        self._last_plotted_key: Optional[Tuple[str, int]] = None
+        # st_mtime_ns per file, refreshed by the table's stat pass
+        self._file_mtimes_ns: Dict[Path, int] = {}
 
         # Cached data for saving
         self._last_wavelengths: Optional[np.ndarray] = None
@@ -99,6 +177,10 @@ class MainController(QObject):
         self._last_sif_info: Optional[object] = None
         self._last_fit_result: Optional[dict] = None
 
+        # Scratch buffer for the fit mask, reused while the spectrum length
+        # stays the same (it is only consumed synchronously in _plot_file)
+        self._mask_scratch: Optional[np.ndarray] = None
+
         # Fitting / plotting limits
         self._global_xmin: Optional[float] = None
         self._global_xmax: Optional[float] = None
@@ -113,7 +195,7 @@ class MainController(QObject):
         self._setup_excluded_regions_table()
         self._connect_signals()
 
-        QApplication.instance().aboutToQuit.connect(self._cleanup_threads)
+        QApplication.instance().aboutToQuit.connect(self._cleanup_watcher)
 
     # ------------------------------------------------------------------ #
     # UI wiring
@@ -135,6 +217,8 @@ class MainController(QObject):
         tbl.setColumnCount(1)
         tbl.setHorizontalHeaderLabels(["File name"])
         tbl.horizontalHeader().setStretchLastSection(True)
+        # Single stretched column: no per-refresh content measuring needed
+        tbl.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         tbl.verticalHeader().setVisible(False)
         tbl.setEditTriggers(tbl.EditTrigger.NoEditTriggers)
         tbl.setSelectionBehavior(tbl.SelectionBehavior.SelectRows)
@@ -146,15 +230,13 @@ class MainController(QObject):
     # ------------------------------------------------------------------ #
     def _populate_corrections_list(self) -> None:
         """Fill QListWidget with available corrections (all *checked*)."""
-        lw = self.ui.corrections_listWidget
-        lw.blockSignals(True)
-        lw.clear()
-        for name in self._corr_manager.available_corrections():
-            item = QListWidgetItem(name)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsSelectable)
-            item.setCheckState(Qt.Checked)
-            lw.addItem(item)
-        lw.blockSignals(False)
+        with _bulk_update(self.ui.corrections_listWidget) as lw:
+            lw.clear()
+            for name in self._corr_manager.available_corrections():
+                item = QListWidgetItem(name)
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsSelectable)
+                item.setCheckState(Qt.Checked)
+                lw.addItem(item)
 
     # ------------------------------------------------------------------ #
     # Global range controls
@@ -306,16 +388,22 @@ class MainController(QObject):
         if self._watcher:
             self._watcher.files_changed.disconnect(self._on_files_changed)
             self._watcher.stop()
+            self._watcher.deleteLater()
         self._current_dir = directory
-        self._watcher = DirectoryWatcher(directory)
+        self._watcher = DirectoryWatcher(directory, parent=self)
         self._watcher.files_changed.connect(self._on_files_changed)
         self._watcher.start()
 
     @Slot(list)
     def _on_files_changed(self, files: List[Path]) -> None:
         sorted_files = self._populate_table(files)
-        if sorted_files:
-            self._plot_file(sorted_files[0])
+        if not sorted_files:
+            return
+        newest = sorted_files[0]
+        key = self._plot_key(newest)
+        if key is not None and key == self._last_plotted_key:
+            return  # newest spectrum is already on screen – nothing to redo
+        self._plot_file(newest)
 
     # ------------------------------------------------------------------ #
     # Corrections toggled / info
@@ -406,14 +494,16 @@ class MainController(QObject):
     # Table helpers
     # ------------------------------------------------------------------ #
     def _populate_table(self, files: List[Path]) -> List[Path]:
-        files.sort(key=lambda p: p.stat().st_ctime, reverse=True)
-        tbl = self.ui.tableWidget
-        tbl.setRowCount(len(files))
-        for row, path in enumerate(files):
-            item = QTableWidgetItem(path.name)
-            item.setData(Qt.ItemDataRole.UserRole, str(path))
-            tbl.setItem(row, 0, item)
-        tbl.resizeColumnsToContents()
+        # One stat per file serves both the sort and the replot gate
+        stats = {p: p.stat() for p in files}
+        self._file_mtimes_ns = {p: st.st_mtime_ns for p, st in stats.items()}
+        files.sort(key=lambda p: stats[p].st_ctime, reverse=True)
+        with _bulk_update(self.ui.tableWidget) as tbl:
+            tbl.setRowCount(len(files))
+            for row, path in enumerate(files):
+                item = QTableWidgetItem(path.name)
+                item.setData(Qt.ItemDataRole.UserRole, str(path))
+                tbl.setItem(row, 0, item)
         return files
 
     # ------------------------------------------------------------------ #
@@ -427,6 +517,16 @@ class MainController(QObject):
         if self._last_plot_path and self._last_plot_path.exists():
             self._plot_file(self._last_plot_path)
 
+    def _plot_key(self, path: Path) -> Optional[Tuple[str, int]]:
+        """Return ``(path, st_mtime_ns)`` identifying the file's current content."""
+        mtime_ns = self._file_mtimes_ns.get(path)
+        if mtime_ns is None:
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                return None
+        return str(path), mtime_ns
+
     def _plot_file(self, path: Path) -> None:
         try:
             wavelengths_nm, counts, sif_info = self._read_sif(path)
@@ -438,8 +538,11 @@ class MainController(QObject):
 
         corrected_counts = self._corr_manager.apply(wavelengths_nm, counts)
 
-        # Build fit mask
-        fit_mask = np.ones_like(wavelengths_nm, dtype=bool)
+        # Build fit mask (in the reusable scratch buffer)
+        if self._mask_scratch is None or self._mask_scratch.size != wavelengths_nm.size:
+            self._mask_scratch = np.empty(wavelengths_nm.size, dtype=bool)
+        fit_mask = self._mask_scratch
+        fit_mask.fill(True)
         if self._global_xmin is not None:
             fit_mask &= wavelengths_nm >= self._global_xmin
         if self._global_xmax is not None:
@@ -449,11 +552,12 @@ class MainController(QObject):
 
         fit_result: Optional[dict] = None
         if np.any(fit_mask):
+            fit_wavelengths = wavelengths_nm[fit_mask]
             try:
                 fit_result = self._temp_manager.fit(
-                    wavelengths_nm[fit_mask], corrected_counts[fit_mask]
+                    fit_wavelengths, corrected_counts[fit_mask]
                 )
-                fit_result["fit_wavelengths"] = wavelengths_nm[fit_mask]
+                fit_result["fit_wavelengths"] = fit_wavelengths
             except Exception as err:
                 print(f"[WARNING] Fit failed: {err}")
 
@@ -476,6 +580,7 @@ class MainController(QObject):
 
         # Cache data for saving
         self._last_plot_path = path
+        self._last_plotted_key = self._plot_key(path)
         self._last_wavelengths = wavelengths_nm
         self._last_counts = counts
         self._last_sif_info = sif_info
@@ -487,6 +592,24 @@ class MainController(QObject):
     # ---- SIF reader --------------------------------------------------- #
     @staticmethod
     def _read_sif(path: Path) -> Tuple[np.ndarray, np.ndarray, object]:
+        # Fast path: memory-map the frame data so the counts are converted
+        # straight from the page cache instead of via an intermediate buffer.
+        try:
+            frames, info = sif_np_open(str(path), lazy="memmap")
+        except ValueError:
+            frames = None  # non-contiguous frames cannot be memory-mapped
+        if frames is not None:
+            wavelengths = extract_calibration(info)
+            counts = np.array(frames, dtype=float).reshape(-1)
+            del frames  # release the mapping (and file handle) right away
+            if (
+                wavelengths is not None
+                and np.ndim(wavelengths) == 1
+                and np.size(wavelengths) == counts.size
+            ):
+                return np.asarray(wavelengths, float), counts, info
+
+        # Fallback: let sif_parser read and assemble everything itself
         data, info = sif_parse(str(path))
         if data.ndim != 2 or data.shape[1] < 2:
             raise ValueError("Unexpected SIF data shape")
@@ -496,7 +619,7 @@ class MainController(QObject):
     # Shutdown
     # ------------------------------------------------------------------ #
     @Slot()
-    def _cleanup_threads(self) -> None:
+    def _cleanup_watcher(self) -> None:
         if self._watcher:
             self._watcher.stop()
             self._watcher = None
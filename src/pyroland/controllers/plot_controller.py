@@ -7,30 +7,49 @@ grey (data) / dark-red (fit) once more.
 """
 from __future__ import annotations
 
-from typing import Iterable, Mapping, Any, Optional, List, Tuple
+from typing import Iterable, Mapping, Any, Optional, Tuple
 
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QPointF
+from PySide6.QtWidgets import QGraphicsItem
 from pyqtgraph.graphicsItems.LegendItem import ItemSample
 from pyqtgraph import functions as fn
 
+from pyroland.gui.plot_widget import SpectrumPlotWidget
 from pyroland.scripts.temperature_fitter import TemperatureFitter
 
 
 # --------------------------------------------------------------------------- #
 #                               Helper functions                              #
 # --------------------------------------------------------------------------- #
-def _build_segments(mask: np.ndarray) -> List[Tuple[int, int]]:
-    """Return list of contiguous *(start, stop)* slices where mask is True."""
-    if mask.size == 0:
-        return []
+def _same_array(a: np.ndarray, b: np.ndarray) -> bool:
+    """True if *a* and *b* hold identical values."""
+    return a.shape == b.shape and np.array_equal(a, b)
+
+
+def _masked_runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the indices where *mask* is True plus a pyqtgraph ``connect`` array.
+
+    ``connect[i]`` is True when index ``i`` and ``i + 1`` lie in the same
+    contiguous run, so a single curve draws every run without bridging gaps.
+    """
     idx = np.flatnonzero(mask)
-    if idx.size == 0:
-        return []
-    splits = np.where(np.diff(idx) != 1)[0] + 1
-    groups = np.split(idx, splits)
-    return [(g[0], g[-1] + 1) for g in groups]
+    # A run continues past True sample i exactly when mask[i + 1] is True:
+    # shift the mask by one (1-byte lanes) instead of diffing int64 indices.
+    continues = np.zeros(mask.size, dtype=bool)
+    continues[:-1] = mask[1:]
+    return idx, continues[idx]
+
+
+def _masked_copy(
+    src: np.ndarray, excluded: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """Copy *src* into *out* with the *excluded* samples set to NaN."""
+    np.copyto(out, src)
+    out[excluded] = np.nan
+    return out
 
 
 # --------------------------------------------------------------------------- #
@@ -43,12 +62,12 @@ class BigSample(ItemSample):
         super().__init__(item)
         self.setFixedWidth(40)
         self.setFixedHeight(40)
+        # Built once – paint() runs on every legend repaint
+        self._pen = fn.mkPen(item.opts["pen"])
+        self._pen.setWidth(3)
 
     def paint(self, painter, *args):  # noqa: D401
-        opts = self.item.opts
-        pen = fn.mkPen(opts["pen"])
-        pen.setWidth(3)
-        painter.setPen(pen)
+        painter.setPen(self._pen)
         h = self.height() / 2
         w = self.width() - 2
         painter.drawLine(1, h, w, h)
@@ -60,8 +79,16 @@ class BigSample(ItemSample):
 class PlotController:
     """Encapsulates all interactions with a :class:`pyqtgraph.PlotWidget`."""
 
+    # Planck tails drawn outside the measured range (nm, samples per side)
+    _TAIL_MIN_NM = 10.0
+    _TAIL_MAX_NM = 20000.0
+    _TAIL_POINTS = 80
+
+    # Relative change in data extent below which the view is not re-ranged
+    _RANGE_TOLERANCE = 0.01
+
     # ------------------------- initialisation ------------------------- #
-    def __init__(self, plot_widget: pg.PlotWidget) -> None:
+    def __init__(self, plot_widget: SpectrumPlotWidget) -> None:
         self._widget = plot_widget
         self._plot_item: pg.PlotItem = plot_widget.getPlotItem()
         self._view_box: pg.ViewBox = self._plot_item.getViewBox()
@@ -70,6 +97,12 @@ class PlotController:
         self._plot_item.showGrid(x=True, y=True, alpha=0.3)
         self._plot_item.setLabel("bottom", "wavelength (nm)")
         self._plot_item.setLabel("left", "counts (bg corrected)")
+        # Axes (and the grid they paint) are re-rendered from a cached
+        # pixmap until the view range actually changes
+        for name in ("left", "bottom", "top", "right"):
+            self._plot_item.getAxis(name).setCacheMode(
+                QGraphicsItem.CacheMode.DeviceCoordinateCache
+            )
 
         # Pens
         self._pen_data_in = pg.mkPen("w", width=2)
@@ -77,14 +110,25 @@ class PlotController:
         self._pen_fit_in = pg.mkPen("r", width=1.5)
         self._pen_fit_out = pg.mkPen((140, 20, 20), width=1.5)
 
-        # Primary (in-fit) curves
+        # Primary (in-fit) curves – excluded samples are NaN, so break the
+        # line at non-finite points directly instead of letting 'auto' probe
         self._data_in = self._plot_item.plot(pen=self._pen_data_in,
-                                             name="Collected spectrum")
-        self._fit_in = self._plot_item.plot(pen=self._pen_fit_in)
-
-        # Pools for excluded segments (data + fit)
-        self._data_out_segments: List[pg.PlotDataItem] = []
-        self._fit_out_segments: List[pg.PlotDataItem] = []
+                                             name="Collected spectrum",
+                                             connect="finite")
+        self._fit_in = self._plot_item.plot(pen=self._pen_fit_in,
+                                            connect="finite")
+        # Long spectra: draw only what is on screen, at most ~2 vertices per
+        # pixel column (peak mode keeps each bin's min/max)
+        for curve in (self._data_in, self._fit_in):
+            curve.setDownsampling(auto=True, method="peak")
+            curve.setClipToView(True)
+            # Overlay-only repaints (legend, title) reuse the cached curve
+            curve.curve.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+        # Excluded segments (data + fit): one curve each, runs separated
+        # via a per-point ``connect`` array
+        self._data_out = self._plot_item.plot(pen=self._pen_data_out)
+        self._fit_out = self._plot_item.plot(pen=self._pen_fit_out)
 
         # Full tails of Planck curve outside measured domain
         self._fit_tail_left = self._plot_item.plot(pen=self._pen_fit_out)
@@ -92,18 +136,52 @@ class PlotController:
         for tail in (self._fit_tail_left, self._fit_tail_right):
             if hasattr(tail, "setIgnoreBounds"):
                 tail.setIgnoreBounds(True)
+            # Only the on-screen part of a tail is turned into a path
+            tail.setClipToView(True)
 
         # Legend
         self._legend = self._plot_item.addLegend(
             offset=(10, 10), labelTextSize="20pt", sampleType=BigSample
         )
+        # Fit label currently shown ("" → data only, None → never built)
+        self._legend_label: Optional[str] = None
+
+        # Last unit-scale (S = 1) Planck curve evaluated on the measured grid:
+        # (copy of wavelengths_nm, T, curve).  Replots of the same spectrum at the same
+        # temperature reuse it instead of re-running the exp() pass.
+        self._planck_cache: Optional[
+            Tuple[np.ndarray, float, np.ndarray]
+        ] = None
+
+        # Copies of (x, y, fit_mask) currently drawn by the data curves
+        self._data_shown: Optional[
+            Tuple[np.ndarray, np.ndarray, np.ndarray]
+        ] = None
+        # (title, fit scalars) of the last frame; with _data_shown it
+        # identifies a redundant plot_spectrum() call
+        self._frame_sig: Optional[Tuple[Any, ...]] = None
+
+        # Reusable buffers for the measured grid in metres, its unit-scale
+        # Planck curve, the scaled model and the NaN-gapped (float32) in-fit
+        # curves; reallocated only when the spectrum length changes
+        self._lam_m_buf: np.ndarray = np.empty(0)
+        self._planck_buf: np.ndarray = np.empty(0)
+        self._model_buf: np.ndarray = np.empty(0)
+        self._y_in_buf: np.ndarray = np.empty(0)
+        self._fit_in_buf: np.ndarray = np.empty(0)
+
+        # (T, S, x_min, x_max) the Planck tails were last drawn for
+        self._tail_key: Optional[Tuple[float, float, float, float]] = None
+
+        # Data extent (x0, x1, y0, y1) the view was last auto-ranged on
+        self._ranged_bounds: Optional[Tuple[float, float, float, float]] = None
 
         # Cache for double-click auto-range
         self._last_x: np.ndarray = np.array([])
         self._last_y: np.ndarray = np.array([])
 
-        # Double-click reset
-        self._widget.scene().sigMouseClicked.connect(self._on_mouse_click)
+        # Double-click reset (emitted only on real double-clicks)
+        self._widget.sigDoubleClicked.connect(self._on_double_click)
 
     # ------------------------------------------------------------------ #
     # Public API                                                         #
@@ -133,128 +211,294 @@ class PlotController:
         if fit_mask is None or fit_mask.size != x_data.size:
             fit_mask = np.ones_like(x_data, dtype=bool)
 
-        excluded_segments = _build_segments(~fit_mask)
+        # Curves are clipped to the view (a bisect over x), which requires an
+        # ascending grid; the calibration does not guarantee one, so reorder
+        # once here and let everything below assume ascending x.
+        if (x_data[1:] < x_data[:-1]).any():
+            x_data, y_data, fit_mask, fit = self._sorted_by_wavelength(
+                x_data, y_data, fit_mask, fit
+            )
+
+        # Duplicate emission (same spectrum, mask, fit and title) → nothing
+        # to redraw.  Arrays are compared by value against copies of the
+        # last frame, so buffers refilled in place are always redrawn.
+        frame_sig = (
+            title or "",
+            None if not fit else (
+                float(fit["T"]), float(fit.get("S", 0.0)),
+                fit.get("T_err"), fit.get("gof"),
+            ),
+        )
+        if frame_sig == self._frame_sig and self._is_shown(x_data, y_data, fit_mask):
+            return
+
+        # Keep intermediate curve states from re-ranging the view, and
+        # coalesce all setData calls into a single repaint at the end.
+        self._plot_item.disableAutoRange()
+        self._widget.setUpdatesEnabled(False)
+        try:
+            self._update_curves(x_data, y_data, fit, fit_mask)
+            self._plot_item.setTitle(title or "")
+            self._frame_sig = frame_sig
+        finally:
+            self._widget.setUpdatesEnabled(True)
+            self._widget.update()
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers                                                   #
+    # ------------------------------------------------------------------ #
+    def _update_curves(
+        self,
+        x_data: np.ndarray,
+        y_data: np.ndarray,
+        fit: Optional[Mapping[str, Any]],
+        fit_mask: np.ndarray,
+    ) -> None:
+        """Push the spectrum, fit, tails and legend for one frame."""
+        if self._lam_m_buf.size != x_data.size:
+            self._allocate_buffers(x_data.size)
+        excluded = ~fit_mask
+        out_idx, out_connect = _masked_runs(excluded)
+        # Any sample inside the fit range? (free: counted by the run split)
+        show_fit = bool(fit) and out_idx.size < fit_mask.size
+        x_min, x_max = float(x_data.min()), float(x_data.max())
+        y_min, y_max = float(y_data.min()), float(y_data.max())
+        # Curves are handed to pyqtgraph as float32 (half the bytes through
+        # clipping/downsampling); all maths above stays in float64
+        x_plot = x_data.astype(np.float32)
 
         # ---------------------------------------------------------------- #
-        # 1) Collected spectrum                                            #
+        # 1) Collected spectrum (skipped if grid, counts and mask match the  #
+        #    previous frame – e.g. a replot that only changes the fit)       #
         # ---------------------------------------------------------------- #
-        self._data_in.setData(x_data, np.where(fit_mask, y_data, np.nan))
+        if not self._is_shown(x_data, y_data, fit_mask):
+            self._data_in.setData(
+                x_plot, _masked_copy(y_data, excluded, self._y_in_buf)
+            )
+
+            if out_idx.size:
+                self._data_out.setData(x_plot[out_idx],
+                                       y_data[out_idx].astype(np.float32),
+                                       connect=out_connect)
+            else:
+                self._data_out.clear()
 
-        self._ensure_pool(self._data_out_segments,
-                          len(excluded_segments),
-                          self._pen_data_out)
-        for i, (start, stop) in enumerate(excluded_segments):
-            self._data_out_segments[i].setData(x_data[start:stop],
-                                               y_data[start:stop])
-        for j in range(len(excluded_segments), len(self._data_out_segments)):
-            self._data_out_segments[j].clear()
+            # Callers may refill their arrays in place (e.g. correct(...,
+            # out=counts)) → keep copies so the comparison is by value
+            self._data_shown = (x_data.copy(), y_data.copy(), fit_mask.copy())
 
         # ---------------------------------------------------------------- #
         # 2) Planck fit                                                    #
         # ---------------------------------------------------------------- #
-        self._fit_in.clear()
-        for seg in self._fit_out_segments:
-            seg.clear()
-        self._fit_tail_left.clear()
-        self._fit_tail_right.clear()
-
-        if fit and np.any(fit_mask):
+        # Curves are overwritten with setData below; only those that end up
+        # without data are cleared, so no curve is cleared and then re-set.
+        if show_fit:
             T = float(fit["T"])
-            model_subset = np.asarray(fit["model_counts"], dtype=float)
-            lambda_subset = np.asarray(
-                fit.get("fit_wavelengths", x_data[fit_mask]), dtype=float
-            )
 
-            # Scaling factor S
+            # Unit-scale Planck curve on the grid: one exp() pass serves both
+            # the S estimate below and the plotted model
+            base_all = self._planck_on_grid(x_data, T)
+
+            # Scaling factor S (re-estimated only if the fit did not report one)
             S = float(fit.get("S", 0.0))
             if S <= 0.0:
-                planck_subset = TemperatureFitter._planck(
-                    lambda_subset * 1e-9, T, 1.0
-                )
-                denom = np.sum(planck_subset**2)
-                S = np.sum(model_subset * planck_subset) / denom if denom else 0.0
+                model_subset = np.asarray(fit["model_counts"], dtype=float)
+                lambda_subset = fit.get("fit_wavelengths")
+                if lambda_subset is None:
+                    # Fit ran on the masked grid → reuse the grid curve
+                    planck_subset = base_all[fit_mask]
+                else:
+                    planck_subset = TemperatureFitter._planck(
+                        np.asarray(lambda_subset, dtype=float) * 1e-9, T, 1.0
+                    )
+                # Least-squares scale via BLAS dot products (no temporaries)
+                denom = float(planck_subset @ planck_subset)
+                S = float(model_subset @ planck_subset) / denom if denom else 0.0
 
-            model_all = TemperatureFitter._planck(x_data * 1e-9, T, S)
+            model_all = np.multiply(base_all, S, out=self._model_buf)
 
             # In-fit part (red, with NaN gaps)
-            self._fit_in.setData(x_data,
-                                 np.where(fit_mask, model_all, np.nan))
+            self._fit_in.setData(
+                x_plot, _masked_copy(model_all, excluded, self._fit_in_buf)
+            )
 
             # Excluded segments (dark red)
-            self._ensure_pool(self._fit_out_segments,
-                              len(excluded_segments),
-                              self._pen_fit_out)
-            for i, (start, stop) in enumerate(excluded_segments):
-                self._fit_out_segments[i].setData(
-                    x_data[start:stop], model_all[start:stop]
-                )
-            for j in range(len(excluded_segments), len(self._fit_out_segments)):
-                self._fit_out_segments[j].clear()
+            if out_idx.size:
+                self._fit_out.setData(x_plot[out_idx],
+                                      model_all[out_idx].astype(np.float32),
+                                      connect=out_connect)
+            else:
+                self._fit_out.clear()
 
             # Auto-range on visible measured data + fit
-            self._view_box.autoRange()
-            self._plot_item.disableAutoRange()
-
-            # Planck tails (ignored in range)
-            x_left = (np.arange(10.0, x_data.min(), 10.0)
-                      if x_data.min() > 10 else np.array([]))
-            x_right = (np.arange(x_data.max() + 10.0, 20001.0, 10.0)
-                       if x_data.max() < 20000 else np.array([]))
-
-            if x_left.size:
-                self._fit_tail_left.setData(
-                    x_left, TemperatureFitter._planck(x_left * 1e-9, T, S)
-                )
-            if x_right.size:
-                self._fit_tail_right.setData(
-                    x_right, TemperatureFitter._planck(x_right * 1e-9, T, S)
-                )
+            self._auto_range((
+                x_min,
+                x_max,
+                min(y_min, float(model_all.min())),
+                max(y_max, float(model_all.max())),
+            ))
+
+            # Planck tails (ignored in range) – they depend only on T, S and
+            # the data extent, so mask edits leave them untouched
+            tail_key = (T, S, x_min, x_max)
+            if tail_key != self._tail_key:
+                self._set_tails(T, S, x_min, x_max)
+                self._tail_key = tail_key
         else:
+            self._fit_in.clear()
+            self._fit_out.clear()
+            self._fit_tail_left.clear()
+            self._fit_tail_right.clear()
+            self._tail_key = None
+
             # No fit → auto-range on data only
-            self._view_box.autoRange()
-            self._plot_item.disableAutoRange()
+            self._auto_range((x_min, x_max, y_min, y_max))
 
         # ---------------------------------------------------------------- #
-        # Legend                                                           #
+        # Legend (rebuilt only when its text changes)                      #
         # ---------------------------------------------------------------- #
-        self._legend.clear()
-        self._legend.addItem(self._data_in, "Collected spectrum")
-        if fit and np.any(fit_mask):
-            self._legend.addItem(
-                self._fit_in,
-                f"T = {fit['T']:.0f} ± {fit['T_err']:.0f} K, "
-                f"R\u00B2 = {fit['gof']:.3f}",
-            )
-
-        self._plot_item.setTitle(title or "")
+        fit_label = (
+            f"T = {fit['T']:.0f} ± {fit['T_err']:.0f} K, "
+            f"R\u00B2 = {fit['gof']:.3f}"
+            if show_fit
+            else ""
+        )
+        if fit_label != self._legend_label:
+            self._legend.clear()
+            self._legend.addItem(self._data_in, "Collected spectrum")
+            if fit_label:
+                self._legend.addItem(self._fit_in, fit_label)
+            self._legend_label = fit_label
+
+    @staticmethod
+    def _sorted_by_wavelength(
+        x_data: np.ndarray,
+        y_data: np.ndarray,
+        fit_mask: np.ndarray,
+        fit: Optional[Mapping[str, Any]],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[Mapping[str, Any]]]:
+        """Return the frame reordered to ascending wavelength."""
+        order = np.argsort(x_data, kind="stable")
+        if fit and fit.get("fit_wavelengths") is None and "model_counts" in fit:
+            # model_counts follows x_data[fit_mask]; a stable sort of that
+            # subset matches its order within the sorted grid
+            model = np.asarray(fit["model_counts"])
+            if model.size == np.count_nonzero(fit_mask):
+                sub_order = np.argsort(x_data[fit_mask], kind="stable")
+                fit = {**fit, "model_counts": model[sub_order]}
+        return x_data[order], y_data[order], fit_mask[order], fit
+
+    def _is_shown(
+        self, x_data: np.ndarray, y_data: np.ndarray, fit_mask: np.ndarray
+    ) -> bool:
+        """True if the data curves already show *x_data*, *y_data*, *fit_mask*."""
+        shown = self._data_shown
+        return (
+            shown is not None
+            and _same_array(x_data, shown[0])
+            and _same_array(y_data, shown[1])
+            and _same_array(fit_mask, shown[2])
+        )
 
-    # ------------------------------------------------------------------ #
-    # Internal helpers                                                   #
-    # ------------------------------------------------------------------ #
-    def _on_mouse_click(self, ev: pg.MouseClickEvent) -> None:
+    def _on_double_click(self, scene_pos: QPointF) -> None:
         """Double-left-click → reset to measured spectrum bounds only."""
-        if ev.double() and ev.button() == Qt.LeftButton:
-            if self._view_box.sceneBoundingRect().contains(ev.scenePos()):
-                if self._last_x.size and self._last_y.size:
-                    x0, x1 = float(self._last_x.min()), float(self._last_x.max())
-                    y0, y1 = float(self._last_y.min()), float(self._last_y.max())
-                    if x0 == x1:
-                        x0 -= 0.5
-                        x1 += 0.5
-                    if y0 == y1:
-                        y0 -= 1
-                        y1 += 1
-                    self._plot_item.setRange(
-                        xRange=(x0, x1), yRange=(y0, y1), padding=0.05
-                    )
-                    self._plot_item.disableAutoRange()
-                else:
-                    self._view_box.autoRange()
-                    self._plot_item.disableAutoRange()
+        if not self._view_box.sceneBoundingRect().contains(scene_pos):
+            return
+        if self._last_x.size and self._last_y.size:
+            x0, x1 = float(self._last_x.min()), float(self._last_x.max())
+            y0, y1 = float(self._last_y.min()), float(self._last_y.max())
+            if x0 == x1:
+                x0 -= 0.5
+                x1 += 0.5
+            if y0 == y1:
+                y0 -= 1
+                y1 += 1
+            self._plot_item.setRange(
+                xRange=(x0, x1), yRange=(y0, y1), padding=0.05
+            )
+            self._plot_item.disableAutoRange()
+        else:
+            self._view_box.autoRange()
+            self._plot_item.disableAutoRange()
+
+    def _auto_range(self, bounds: Tuple[float, float, float, float]) -> None:
+        """
+        Range the view on *bounds* (x0, x1, y0, y1) unless they are within
+        :attr:`_RANGE_TOLERANCE` of the bounds the view was last ranged on.
 
-    def _ensure_pool(
-        self, pool: List[pg.PlotDataItem], size: int, pen: pg.functions.mkPen
+        The bounds are the ones ``autoRange()`` would find, but computed from
+        the arrays already at hand instead of by querying every curve.
+        """
+        last = self._ranged_bounds
+        if last is not None:
+            x_tol = self._RANGE_TOLERANCE * (last[1] - last[0])
+            y_tol = self._RANGE_TOLERANCE * (last[3] - last[2])
+            if (
+                abs(bounds[0] - last[0]) <= x_tol
+                and abs(bounds[1] - last[1]) <= x_tol
+                and abs(bounds[2] - last[2]) <= y_tol
+                and abs(bounds[3] - last[3]) <= y_tol
+            ):
+                return
+        x0, x1, y0, y1 = bounds
+        if np.isfinite(bounds).all():
+            # padding=None → ViewBox's default auto-range padding
+            self._view_box.setRange(xRange=(x0, x1), yRange=(y0, y1),
+                                    padding=None)
+        else:
+            self._view_box.autoRange()  # NaN/inf samples: let pyqtgraph cope
+        self._plot_item.disableAutoRange()
+        self._ranged_bounds = bounds
+
+    def _set_tails(self, T: float, S: float, x_min: float, x_max: float) -> None:
+        """Draw the Planck tails left of *x_min* and right of *x_max*."""
+        # Log-spaced: Planck is smooth here, a few dozen points suffice
+        x_left = (np.geomspace(self._TAIL_MIN_NM, x_min,
+                               self._TAIL_POINTS, endpoint=False)
+                  if x_min > self._TAIL_MIN_NM else np.array([]))
+        x_right = (np.geomspace(x_max, self._TAIL_MAX_NM,
+                                self._TAIL_POINTS + 1)[1:]
+                   if x_max < self._TAIL_MAX_NM else np.array([]))
+
+        self._set_tail(self._fit_tail_left, x_left, T, S)
+        self._set_tail(self._fit_tail_right, x_right, T, S)
+
+    @staticmethod
+    def _set_tail(
+        curve: pg.PlotDataItem, x_nm: np.ndarray, T: float, S: float
     ) -> None:
-        """Make sure *pool* contains at least *size* PlotDataItems."""
-        while len(pool) < size:
-            pool.append(self._plot_item.plot(pen=pen))
+        """Draw the Planck curve over *x_nm* on *curve* (or clear it if empty).
+
+        Tails are display-only, so the model is evaluated in float64 (the
+        exp() range needs it) but handed to pyqtgraph as float32.
+        """
+        if not x_nm.size:
+            curve.clear()
+            return
+        model = TemperatureFitter._planck(x_nm * 1e-9, T, S)
+        curve.setData(x_nm.astype(np.float32), model.astype(np.float32))
+
+    def _planck_on_grid(self, x_nm: np.ndarray, T: float) -> np.ndarray:
+        """Unit-scale Planck curve on *x_nm*, reusing the previous result."""
+        cache = self._planck_cache
+        if cache is not None:
+            x_prev, T_prev, curve_prev = cache
+            if T == T_prev and _same_array(x_nm, x_prev):
+                return curve_prev
+
+        # One cheap pass; redone on every miss so a grid changed in place
+        # can never leave a stale metre buffer behind
+        np.multiply(x_nm, 1e-9, out=self._lam_m_buf)
+        curve = TemperatureFitter._planck(
+            self._lam_m_buf, T, 1.0, out=self._planck_buf
+        )
+        self._planck_cache = (x_nm.copy(), T, curve)
+        return curve
+
+    def _allocate_buffers(self, n: int) -> None:
+        """(Re)allocate the per-sample scratch buffers for *n* samples."""
+        self._lam_m_buf = np.empty(n, dtype=float)
+        self._planck_buf = np.empty(n, dtype=float)
+        self._model_buf = np.empty(n, dtype=float)
+        self._y_in_buf = np.empty(n, dtype=np.float32)
+        self._fit_in_buf = np.empty(n, dtype=np.float32)
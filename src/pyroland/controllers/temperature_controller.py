@@ -57,8 +57,9 @@ class TemperatureController:
             wavelengths_nm, counts, yerr  # type: ignore[arg-type]
         )
 
-        # Evaluate the model on the *same* wavelength grid
-        model_counts = self._fitter._planck(wavelengths_nm * 1e-9, T, S)
+        # Best-fit model on the *same* wavelength grid – the fitter keeps the
+        # curve it evaluated at the optimum, so it is reused, not recomputed
+        model_counts = self._fitter.model
 
         return {
             "model_counts": model_counts,
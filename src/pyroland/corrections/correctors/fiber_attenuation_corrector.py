@@ -1,10 +1,12 @@
+import math
+
 import numpy as np
-import pandas as pd
-from scipy.interpolate import interp1d
-import matplotlib.pyplot as plt
+
+from pyroland.corrections.correctors.response_corrector import ResponseCorrector
+from pyroland.corrections.tables import read_columns
 
 
-class FiberAttenuationCorrector:
+class FiberAttenuationCorrector(ResponseCorrector):
     """
     Loads fiber attenuation data from a CSV and applies it to correct
     raw spectrometer counts for fiber optic attenuation.
@@ -14,34 +16,38 @@ class FiberAttenuationCorrector:
         - Column 1: wavelength in nm
         - Column 2: attenuation in dB/km
         - Column 3: attenuation in dB/m
+
+    ``correct()`` (inherited) divides counts by the fiber transmission
+    fraction over the cable length.  ``extrapolate=True`` extends the dB/m
+    table linearly beyond its sampled range (see :class:`ResponseCorrector`).
     """
-    def __init__(self, attenuation_csv_path: str, fiber_length_m: float):
-        # Load CSV and rename columns
-        df = pd.read_csv(attenuation_csv_path)
-        df = df.rename(
-            columns={
-                df.columns[0]: "wavelength_nm",
-                df.columns[1]: "attenuation_dbkm",
-                df.columns[2]: "attenuation_dbm"
-            }
-        )
-        # Parse numeric columns
-        df["wavelength_nm"] = pd.to_numeric(df["wavelength_nm"], errors='coerce')
-        df["attenuation_dbm"] = pd.to_numeric(df["attenuation_dbm"], errors='coerce')
-        if df[["wavelength_nm", "attenuation_dbm"]].isnull().any().any():
+    _LABEL = "Fiber attenuation"
+
+    def __init__(self, attenuation_csv_path: str, fiber_length_m: float,
+                 *, extrapolate: bool = False):
+        # Load wavelength and dB/m columns (the dB/km column is not needed)
+        wavelength_nm, attenuation_dbm = read_columns(attenuation_csv_path, (0, 2))
+        if np.isnan(wavelength_nm).any() or np.isnan(attenuation_dbm).any():
             raise ValueError("Some attenuation values could not be parsed as numbers.")
 
-        # Store data and build interpolator for dB/m
-        self._wl = df["wavelength_nm"].values.astype(float)
-        self._att_dbm = df["attenuation_dbm"].values.astype(float)
+        # The base stores the dB/m table (sorted, contiguous)
+        super().__init__(wavelength_nm, attenuation_dbm, extrapolate=extrapolate)
+        self._att_dbm = self._response
         self._length = float(fiber_length_m)
-        self._interp_att = interp1d(
-            self._wl,
-            self._att_dbm,
-            kind="linear",
-            bounds_error=False,
-            fill_value="extrapolate"
-        )
+        # Total loss over the cable in nepers, α = dB/m · L · ln(10)/10, so
+        # that 1 / transmission = 10^(loss_dB/10) is a single exp(α)
+        self._alpha = self._att_dbm * (self._length * math.log(10.0) / 10.0)
+
+    def _validate_response(self) -> None:
+        """Any finite attenuation is valid: exp(α) is positive for all α."""
+
+    def _compute_inv_response(self, wavelengths: np.ndarray) -> np.ndarray:
+        """1 / fiber transmission on *wavelengths* (uncached)."""
+        # Interpolate the loss (nepers) at measurement wavelengths – linear
+        # in dB/m, so scaling the table first gives the same result
+        alpha = self._interp(wavelengths, self._alpha)
+        # 1 / transmission = exp(+α)
+        return np.exp(alpha, out=alpha)
 
     def _percent_transmission(self, length_m: float | None = None) -> np.ndarray:
         """Return transmission (%) for the stored attenuation curve over a given length."""
@@ -71,43 +77,9 @@ class FiberAttenuationCorrector:
         -------
         ax : matplotlib.axes.Axes
         """
-        if ax is None:
-            fig, ax = plt.subplots()
-
-        y_pct = self._percent_transmission(length_m)
-        ax.plot(self._wl, y_pct, **plot_kwargs)
-        ax.set_xlabel("Wavelength (nm)")
-        ax.set_ylabel("Transmission (%)")
-        ax.set_title("Fiber Transmission vs Wavelength")
-        if xlim is not None:
-            ax.set_xlim(*xlim)
-        ax.grid(True, which="both", alpha=0.3)
-        return ax
-
-    def correct(self, wavelengths: np.ndarray, counts: np.ndarray) -> np.ndarray:
-        """
-        Corrects counts for fiber attenuation over the specified cable length.
-
-        Parameters
-        ----------
-        wavelengths : array-like
-            Wavelengths [nm] corresponding to the counts.
-        counts : array-like
-            Measured counts at each wavelength.
-
-        Returns
-        -------
-        corrected_counts : np.ndarray
-            Counts divided by the fiber transmission fraction.
-        """
-        # Interpolate dB/m attenuation at measurement wavelengths
-        att_dbm_at_meas = self._interp_att(wavelengths)
-        # Total loss in dB = dB/m * length (m)
-        total_loss_db = att_dbm_at_meas * self._length
-        # Transmission fraction = 10^(-loss_dB/10)
-        transmission = 10 ** (-total_loss_db / 10)
-        if np.any(transmission == 0):
-            raise ValueError(
-                "Fiber transmission is zero at some wavelengths; cannot correct."
-            )
-        return counts / transmission
+        return self._draw_curve(
+            self._percent_transmission(length_m),
+            ylabel="Transmission (%)",
+            title="Fiber Transmission vs Wavelength",
+            xlim=xlim, ax=ax, **plot_kwargs,
+        )
@@ -0,0 +1,241 @@
+# file: src/pyroland/corrections/correctors/response_corrector.py
+"""
+response_corrector.py
+---------------------
+
+Common base for the spectral correctors.  Every correction divides measured
+counts by a tabulated, wavelength-dependent response raised to some power:
+
+    counts_true(λ) = counts_measured(λ) / R(λ)ⁿ
+
+Subclasses only load their CSV and hand the curve (as a fraction) to
+:class:`ResponseCorrector`, which interpolates it onto the measurement grid,
+inverts it once per grid and applies it with a single multiply.
+:class:`CompositeResponseCorrector` chains several of them into one combined
+inverse, so a whole pipeline is still a single pass over the counts.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Iterable
+
+import numpy as np
+
+from pyroland.corrections.interpolation import (
+    GridCache,
+    interp_linear,
+    interp_uniform,
+    uniform_step,
+)
+
+__all__ = ["CompositeResponseCorrector", "ResponseCorrector"]
+
+logger = logging.getLogger(__name__)
+
+
+def _apply_inverse(counts: np.ndarray, inv: np.ndarray,
+                   out: np.ndarray | None) -> np.ndarray:
+    """``counts * inv``, keeping float32 counts in float32."""
+    counts = np.asarray(counts)
+    # The cached inverse is float64; for float32 spectra cast it on the fly
+    # rather than promote the whole result (sums over many corrected spectra
+    # should still accumulate in float64)
+    dtype = np.float32 if counts.dtype == np.float32 else None
+    return np.multiply(counts, inv, out=out, dtype=dtype)
+
+
+class ResponseCorrector:
+    """
+    Divide counts by a tabulated response curve R(λ) raised to *exponent*.
+
+    Outside the tabulated range R is held at its end values, unless
+    ``extrapolate=True`` (linear continuation of the end segments).
+
+    The table is sorted and checked once, at construction; interpolation
+    then assumes it – a binary search per wavelength, or direct indexing if
+    the table is evenly spaced.
+    """
+
+    # Name of the response in error messages ("Quantum efficiency", …)
+    _LABEL = "Response"
+
+    def __init__(
+        self,
+        wavelengths_nm: np.ndarray,
+        response: np.ndarray,
+        *,
+        exponent: int = 1,
+        extrapolate: bool = False,
+    ) -> None:
+        # 1 / Rⁿ is built from n - 1 multiplies (or exp(−n·ln R)); only
+        # positive integer powers are meaningful for a chain of optics
+        if (
+            not isinstance(exponent, (int, np.integer))
+            or isinstance(exponent, bool)
+            or exponent < 1
+        ):
+            raise ValueError(
+                f"{self._LABEL} exponent must be a positive integer (≥ 1), "
+                f"got {exponent!r}."
+            )
+
+        # Contiguous float64 table, sorted by wavelength for np.interp
+        order = np.argsort(wavelengths_nm, kind="stable")
+        self._wl = np.ascontiguousarray(np.asarray(wavelengths_nm)[order], dtype=float)
+        self._response = np.ascontiguousarray(np.asarray(response)[order], dtype=float)
+        self._validate_wavelengths()
+        self._validate_response()
+        # Sample spacing if the table is evenly spaced (index, not search)
+        self._step = uniform_step(self._wl)
+
+        self._exponent = int(exponent)
+        self._extrapolate = bool(extrapolate)
+        # 1 / Rⁿ on recently seen measurement grids
+        self._inv_cache = GridCache()
+
+    # ------------------------------------------------------------------ #
+    # Hooks for subclasses
+    # ------------------------------------------------------------------ #
+    def _validate_wavelengths(self) -> None:
+        """Check the (sorted) wavelength table once, at load."""
+        if self._wl.size < 2 or not np.isfinite(self._wl).all():
+            raise ValueError(
+                f"{self._LABEL} table needs at least two finite wavelengths."
+            )
+        # Digitised curves repeat a wavelength at vertical steps; np.interp
+        # takes a consistent side there, so only note it
+        n_dup = int(np.count_nonzero(np.diff(self._wl) == 0))
+        if n_dup:
+            logger.debug("%s table repeats %d wavelength(s)", self._LABEL, n_dup)
+
+    def _validate_response(self) -> None:
+        """Reject tables that cannot be divided by (checked once, at load)."""
+        if np.any(self._response <= 0):
+            raise ValueError(
+                f"{self._LABEL} must be positive at every tabulated wavelength."
+            )
+
+    def _compute_inv_response(self, wavelengths: np.ndarray) -> np.ndarray:
+        """1 / R(λ)ⁿ on *wavelengths* as a new array (uncached)."""
+        resp = self._interp(wavelengths, self._response)
+
+        # The table is positive; only extrapolation can leave that range
+        if self._extrapolate and np.any(resp <= 0):
+            raise ValueError(
+                f"{self._LABEL} extrapolates to zero or below; cannot correct."
+            )
+
+        # Rⁿ without a pow() per element: a short multiply chain for small n,
+        # exp(−n·ln R) beyond that (which also folds in the reciprocal)
+        n = self._exponent
+        if n > 4:
+            np.log(resp, out=resp)
+            resp *= -n
+            return np.exp(resp, out=resp)
+        inv = resp.copy() if n > 1 else resp
+        for _ in range(n - 1):
+            inv *= resp
+        return np.divide(1.0, inv, out=inv)
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _interp(self, wavelengths: np.ndarray, table: np.ndarray) -> np.ndarray:
+        """Interpolate *table* (aligned with ``_wl``) onto *wavelengths*."""
+        if self._step is not None:
+            return interp_uniform(wavelengths, self._wl[0], self._step, table,
+                                  extrapolate=self._extrapolate)
+        return interp_linear(wavelengths, self._wl, table,
+                             extrapolate=self._extrapolate)
+
+    def _inv_response(self, wavelengths: np.ndarray) -> np.ndarray:
+        """1 / R(λ)ⁿ on *wavelengths*, cached per wavelength grid."""
+        inv = self._inv_cache.get(wavelengths)
+        if inv is None:
+            inv = self._inv_cache.put(
+                wavelengths, self._compute_inv_response(wavelengths)
+            )
+        return inv
+
+    def _draw_curve(self, y_pct: np.ndarray, *, ylabel: str, title: str,
+                    xlim: tuple[float, float] | None = None,
+                    ax=None, **plot_kwargs):
+        """Plot *y_pct* against the tabulated wavelengths; return the axis."""
+        # Plotting is a diagnostic path – keep matplotlib out of the import
+        # chain for code that only calls correct()
+        import matplotlib.pyplot as plt
+
+        if ax is None:
+            fig, ax = plt.subplots()
+
+        ax.plot(self._wl, y_pct, **plot_kwargs)
+        ax.set_xlabel("Wavelength (nm)")
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        if xlim is not None:
+            ax.set_xlim(*xlim)
+        ax.grid(True, which="both", alpha=0.3)
+        return ax
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+    def correct(
+        self,
+        wavelengths: np.ndarray,
+        counts: np.ndarray,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Divide *counts* by the interpolated response at each wavelength.
+
+        Parameters
+        ----------
+        wavelengths : array-like
+            Wavelengths [nm] corresponding to *counts*.
+        counts : array-like
+            Measured counts at each wavelength.
+        out : np.ndarray, optional
+            Array to write the result into (as for NumPy ufuncs); may be
+            *counts* itself to correct in place.
+
+        Returns
+        -------
+        corrected_counts : np.ndarray
+            ``counts / R(λ)ⁿ`` (*out*, if given); float32 if *counts* is
+            float32, float64 otherwise.
+        """
+        return _apply_inverse(counts, self._inv_response(wavelengths), out)
+
+
+class CompositeResponseCorrector:
+    """
+    Apply several :class:`ResponseCorrector` instances as one.
+
+    The per-corrector inverses are multiplied into a single combined
+    ``1 / ∏ Rᵢ(λ)ⁿⁱ`` (cached per wavelength grid), so correcting a spectrum
+    costs one multiply however many corrections are chained.
+    """
+
+    def __init__(self, correctors: Iterable[ResponseCorrector]) -> None:
+        self._correctors = tuple(correctors)
+        self._inv_cache = GridCache()
+
+    def _inv_response(self, wavelengths: np.ndarray) -> np.ndarray:
+        """Product of the member inverses on *wavelengths*, cached per grid."""
+        inv = self._inv_cache.get(wavelengths)
+        if inv is None:
+            inv = np.ones(np.shape(wavelengths))
+            for corrector in self._correctors:
+                inv *= corrector._inv_response(wavelengths)
+            inv = self._inv_cache.put(wavelengths, inv)
+        return inv
+
+    def correct(
+        self,
+        wavelengths: np.ndarray,
+        counts: np.ndarray,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Apply every member correction to *counts*; see :meth:`ResponseCorrector.correct`."""
+        return _apply_inverse(counts, self._inv_response(wavelengths), out)
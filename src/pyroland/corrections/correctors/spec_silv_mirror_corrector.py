@@ -1,11 +1,11 @@
 # file: silvered_mirror_correction.py
 import numpy as np
-import pandas as pd
-from scipy.interpolate import interp1d
-import matplotlib.pyplot as plt
 
+from pyroland.corrections.correctors.response_corrector import ResponseCorrector
+from pyroland.corrections.tables import read_columns
 
-class SilveredMirrorCorrection:
+
+class SilveredMirrorCorrection(ResponseCorrector):
     """
     Correct spectrometer counts for the wavelength-dependent reflectivity of one
     or more internal mirrors.
@@ -25,10 +25,13 @@ class SilveredMirrorCorrection:
         counts_true(λ) = counts_measured(λ) / R(λ)ⁿ
     """
 
+    _LABEL = "Reflectivity"
+
     # ------------------------------------------------------------------
     # Construction
     # ------------------------------------------------------------------
-    def __init__(self, reflectivity_csv_path: str, n_mirrors: int = 1):
+    def __init__(self, reflectivity_csv_path: str, n_mirrors: int = 1,
+                 *, extrapolate: bool = False):
         """
         Parameters
         ----------
@@ -36,6 +39,9 @@ class SilveredMirrorCorrection:
             Path to the CSV file containing the reflectivity curve.
         n_mirrors : int, optional
             Number of silvered mirrors in the light path (≥ 1).  Default is 1.
+        extrapolate : bool, optional
+            Extend the reflectivity curve linearly beyond its tabulated
+            wavelengths (see :class:`ResponseCorrector`).  Default is False.
         """
         # Validate mirror count
         if not isinstance(n_mirrors, int) or n_mirrors < 1:
@@ -43,40 +49,26 @@ class SilveredMirrorCorrection:
         self._n_mirrors = n_mirrors
 
         # --------------------------------------------------------------
-        # 1. Load the CSV and normalise column names
-        # --------------------------------------------------------------
-        df = pd.read_csv(reflectivity_csv_path)
-        df = df.rename(columns={
-            df.columns[0]: "wavelength_nm",
-            df.columns[1]: "refl_pct"
-        })
-
-        # --------------------------------------------------------------
-        # 2. Coerce to numeric, stripping stray characters if necessary
+        # 1. Load the CSV, stripping stray characters from the reflectivity
         # --------------------------------------------------------------
-        df["wavelength_nm"] = pd.to_numeric(df["wavelength_nm"], errors="coerce")
-        df["refl_pct"] = pd.to_numeric(
-            df["refl_pct"].astype(str).str.replace(r"[^0-9.\-]", "", regex=True),
-            errors="coerce"
+        wavelength_nm, refl_pct = read_columns(
+            reflectivity_csv_path, (0, 1), strip=(1,)
         )
 
-        if df[["wavelength_nm", "refl_pct"]].isnull().any().any():
+        if np.isnan(wavelength_nm).any() or np.isnan(refl_pct).any():
             raise ValueError(
                 "Some wavelength or reflectivity values could not be parsed as numbers."
             )
 
         # --------------------------------------------------------------
-        # 3. Store arrays and build an interpolator over reflectivity fraction
+        # 2. Hand the reflectivity fraction to the base class; N mirrors
+        #    are its exponent
         # --------------------------------------------------------------
-        self._wl = df["wavelength_nm"].values.astype(float)
-        self._refl_frac = df["refl_pct"].values / 100.0  # % → fraction
-
-        self._interp_refl = interp1d(
-            self._wl,
-            self._refl_frac,
-            kind="linear",
-            bounds_error=False,
-            fill_value="extrapolate"
+        super().__init__(
+            wavelength_nm,
+            refl_pct / 100.0,  # % → fraction
+            exponent=n_mirrors,
+            extrapolate=extrapolate,
         )
 
     # ------------------------------------------------------------------
@@ -84,7 +76,7 @@ class SilveredMirrorCorrection:
     # ------------------------------------------------------------------
     def _percent_reflectivity(self) -> np.ndarray:
         """Return the reflectivity curve in percent (cached)."""
-        return self._refl_frac * 100.0
+        return self._response * 100.0
 
     # ------------------------------------------------------------------
     # Visualisation
@@ -107,48 +99,9 @@ class SilveredMirrorCorrection:
         -------
         ax : matplotlib.axes.Axes
         """
-        if ax is None:
-            fig, ax = plt.subplots()
-
-        y_pct = self._percent_reflectivity()
-        ax.plot(self._wl, y_pct, **plot_kwargs)
-        ax.set_xlabel("Wavelength (nm)")
-        ax.set_ylabel("Reflectivity (%)")
-        ax.set_title(f"Mirror Reflectivity vs Wavelength (N = {self._n_mirrors})")
-        if xlim is not None:
-            ax.set_xlim(*xlim)
-        ax.grid(True, which="both", alpha=0.3)
-        return ax
-
-    # ------------------------------------------------------------------
-    # Public API
-    # ------------------------------------------------------------------
-    def correct(self, wavelengths: np.ndarray, counts: np.ndarray) -> np.ndarray:
-        """
-        Apply the mirror-reflectivity correction.
-
-        Parameters
-        ----------
-        wavelengths : array-like
-            Wavelengths [nm] corresponding to *counts*.
-        counts : array-like
-            Measured counts at each wavelength.
-
-        Returns
-        -------
-        corrected_counts : np.ndarray
-            Counts divided by the cumulative reflectivity R(λ)ⁿ.
-        """
-        # Interpolate single-bounce reflectivity at measurement wavelengths
-        refl_single = self._interp_refl(wavelengths)
-
-        # Total throughput after N reflections
-        refl_total = refl_single ** self._n_mirrors
-
-        # Guard against invalid values
-        if np.any(refl_total <= 0):
-            raise ValueError(
-                "Reflectivity is zero or negative at some wavelengths; cannot correct."
-            )
-
-        return counts / refl_total
+        return self._draw_curve(
+            self._percent_reflectivity(),
+            ylabel="Reflectivity (%)",
+            title=f"Mirror Reflectivity vs Wavelength (N = {self._n_mirrors})",
+            xlim=xlim, ax=ax, **plot_kwargs,
+        )
@@ -0,0 +1,143 @@
+# file: src/pyroland/corrections/interpolation.py
+"""
+interpolation.py
+----------------
+
+Linear interpolation of tabulated response curves (QE, transmission, …) onto
+a measurement wavelength grid, shared by all correctors, plus a small cache
+for results that only depend on that grid.
+
+:func:`numpy.interp` does the work in a single compiled loop.
+
+Tables sampled on an evenly spaced grid (1 nm vendor curves) can skip the
+binary search altogether: :func:`interp_uniform` finds each segment by index
+arithmetic instead.
+"""
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+__all__ = ["GridCache", "interp_linear", "interp_uniform", "uniform_step"]
+
+
+def interp_linear(
+    x: np.ndarray,
+    xp: np.ndarray,
+    fp: np.ndarray,
+    *,
+    extrapolate: bool = False,
+) -> np.ndarray:
+    """
+    Piecewise-linear interpolation of (*xp*, *fp*) at *x*.
+
+    Parameters
+    ----------
+    x : array-like
+        Query points.
+    xp : ndarray
+        Ascending sample points (repeated values allowed).
+    fp : ndarray
+        Sample values, aligned with *xp*.
+    extrapolate : bool, optional
+        Extend the end segments linearly instead of clamping to
+        ``fp[0]`` / ``fp[-1]`` outside ``[xp[0], xp[-1]]``.
+    """
+    y = np.interp(x, xp, fp)
+    if not extrapolate:
+        return y
+
+    x = np.asarray(x, dtype=float)
+    # End segments: the first / last pair of *distinct* sample points, so a
+    # repeated end wavelength does not produce a zero-width slope.
+    lo = min(int(np.searchsorted(xp, xp[0], side="right")), xp.size - 1)
+    hi = max(int(np.searchsorted(xp, xp[-1], side="left")), 1)
+
+    below = x < xp[0]
+    if below.any():
+        slope = (fp[lo] - fp[lo - 1]) / (xp[lo] - xp[lo - 1])
+        y[below] = fp[lo - 1] + slope * (x[below] - xp[lo - 1])
+    above = x > xp[-1]
+    if above.any():
+        slope = (fp[hi] - fp[hi - 1]) / (xp[hi] - xp[hi - 1])
+        y[above] = fp[hi] + slope * (x[above] - xp[hi])
+    return y
+
+
+def uniform_step(xp: np.ndarray, rtol: float = 1e-9) -> Optional[float]:
+    """
+    Spacing of *xp* if its samples are evenly spaced (and ascending), else
+    ``None``.
+    """
+    if xp.size < 2:
+        return None
+    step = (xp[-1] - xp[0]) / (xp.size - 1)
+    if step <= 0 or np.ptp(np.diff(xp)) > rtol * np.abs(xp).max():
+        return None
+    return float(step)
+
+
+def interp_uniform(
+    x: np.ndarray,
+    x0: float,
+    step: float,
+    fp: np.ndarray,
+    *,
+    extrapolate: bool = False,
+) -> np.ndarray:
+    """
+    :func:`interp_linear` for samples at ``x0 + k * step``.
+
+    The segment of each query point is computed directly instead of searched
+    for; outside the table the end segments are clamped or, with
+    *extrapolate*, continued linearly – the same as :func:`interp_linear`.
+    """
+    t = (np.asarray(x, dtype=float) - x0) / step
+    last = fp.size - 1
+    if not extrapolate:
+        np.clip(t, 0, last, out=t)
+
+    # Segment index; fmax/fmin (unlike clip) map NaN queries to segment 0,
+    # so the cast below stays in bounds while t – and thus y – stays NaN,
+    # matching np.interp
+    i = np.floor(t)
+    np.fmax(i, 0, out=i)
+    np.fmin(i, last - 1, out=i)
+    t -= i                              # fractional position in the segment
+    i = i.astype(np.intp)
+
+    lo = fp[i]
+    y = fp[i + 1] - lo
+    y *= t
+    y += lo
+    return y
+
+
+class GridCache:
+    """
+    FIFO cache of arrays computed for a wavelength grid, keyed by the grid's
+    *values* – spectra re-read from disk arrive as new arrays on the same
+    detector axis, so identity alone would never hit.
+    """
+
+    def __init__(self, maxsize: int = 4) -> None:
+        self._maxsize = maxsize
+        self._entries: Dict[Tuple[tuple, str, bytes], np.ndarray] = {}
+
+    @staticmethod
+    def _key(grid: np.ndarray) -> Tuple[tuple, str, bytes]:
+        grid = np.asarray(grid)
+        return grid.shape, grid.dtype.str, grid.tobytes()
+
+    def get(self, grid: np.ndarray) -> Optional[np.ndarray]:
+        """Cached array for *grid*, or ``None``."""
+        return self._entries.get(self._key(grid))
+
+    def put(self, grid: np.ndarray, value: np.ndarray) -> np.ndarray:
+        """Store *value* (made read-only) for *grid* and return it."""
+        if len(self._entries) >= self._maxsize:
+            del self._entries[next(iter(self._entries))]  # oldest first
+        value.flags.writeable = False
+        self._entries[self._key(grid)] = value
+        return value
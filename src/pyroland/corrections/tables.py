@@ -0,0 +1,57 @@
+# file: src/pyroland/corrections/tables.py
+"""
+tables.py
+---------
+
+Loader for the small calibration CSVs shipped with the correctors: one header
+row, then a handful of numeric columns.  NumPy parses them directly, so the
+corrections need neither pandas nor a DataFrame round-trip.
+"""
+from __future__ import annotations
+
+import re
+from typing import Sequence, Tuple
+
+import numpy as np
+
+__all__ = ["read_columns"]
+
+# Anything that cannot be part of a plain decimal number ("%", units, quotes)
+_NON_NUMERIC = re.compile(r"[^0-9.\-]")
+
+
+def _stripped_float(cell: str) -> float:
+    """Parse *cell* after dropping stray characters; NaN if nothing is left."""
+    try:
+        return float(_NON_NUMERIC.sub("", cell))
+    except ValueError:
+        return np.nan
+
+
+def read_columns(
+    path: str,
+    usecols: Sequence[int],
+    *,
+    strip: Sequence[int] = (),
+) -> Tuple[np.ndarray, ...]:
+    """
+    Read the numeric columns *usecols* of a CSV with one header row.
+
+    Cells that do not parse become NaN (callers decide whether that is an
+    error).  Columns listed in *strip* have every character other than
+    digits, ``.`` and ``-`` removed first, so entries like ``"85 %"`` load.
+
+    Returns one float64 array per requested column, in *usecols* order.
+    """
+    columns = np.genfromtxt(
+        path,
+        delimiter=",",
+        skip_header=1,
+        usecols=tuple(usecols),
+        dtype=float,
+        encoding="utf-8",
+        converters={col: _stripped_float for col in strip},
+        ndmin=2,
+        unpack=True,
+    )
+    return tuple(np.ascontiguousarray(col) for col in columns)
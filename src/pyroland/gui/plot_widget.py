@@ -0,0 +1,28 @@
+# file: src/pyroland/gui/plot_widget.py
+"""
+plot_widget.py
+--------------
+
+:class:`pyqtgraph.PlotWidget` subclass promoted in ``mainwindow.ui``.
+
+Double-clicks are reported through a dedicated signal emitted from Qt's
+``mouseDoubleClickEvent``, so listeners run only on real double-clicks instead
+of filtering every click delivered by ``scene().sigMouseClicked``.
+"""
+from __future__ import annotations
+
+import pyqtgraph as pg
+from PySide6.QtCore import QPointF, Qt, Signal
+
+__all__ = ["SpectrumPlotWidget"]
+
+
+class SpectrumPlotWidget(pg.PlotWidget):
+    """PlotWidget that emits :attr:`sigDoubleClicked` on left double-clicks."""
+
+    sigDoubleClicked = Signal(QPointF)  # scene position of the click
+
+    def mouseDoubleClickEvent(self, ev):  # noqa: N802 (Qt signature)
+        super().mouseDoubleClickEvent(ev)
+        if ev.button() == Qt.MouseButton.LeftButton:
+            self.sigDoubleClicked.emit(self.mapToScene(ev.position().toPoint()))
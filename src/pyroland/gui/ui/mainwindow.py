@@ -21,7 +21,7 @@ from PySide6.QtWidgets import (QApplication, QCheckBox, QFrame, QHBoxLayout,
     QSpacerItem, QSplitter, QStatusBar, QTableWidget,
     QTableWidgetItem, QVBoxLayout, QWidget)
 
-from pyqtgraph import PlotWidget
+from pyroland.gui.plot_widget import SpectrumPlotWidget
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -35,7 +35,7 @@ class Ui_MainWindow(object):
         self.splitter = QSplitter(self.centralwidget)
         self.splitter.setObjectName(u"splitter")
         self.splitter.setOrientation(Qt.Orientation.Horizontal)
-        self.plot_widget = PlotWidget(self.splitter)
+        self.plot_widget = SpectrumPlotWidget(self.splitter)
         self.plot_widget.setObjectName(u"plot_widget")
         self.splitter.addWidget(self.plot_widget)
         self.frame = QFrame(self.splitter)
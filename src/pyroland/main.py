@@ -10,6 +10,7 @@ Only UI-behaviour customisation lives here, so that the auto-generated
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from typing import Optional
 
 from PySide6.QtGui import QIcon
@@ -20,6 +21,12 @@ from pyroland.controllers.main_controller import MainController
 from pyroland.util.resources import icon_path
 
 
+@lru_cache(maxsize=None)
+def _window_icon() -> QIcon:
+    """Application icon, decoded once and shared by every window."""
+    return QIcon(str(icon_path()))
+
+
 class MainWindow(QMainWindow):
     """Top-level window with custom splitter behaviour."""
 
@@ -32,11 +39,12 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         # --- build UI generated by QtDesigner --------------------------------
+        # (one Ui_MainWindow per window: it holds this window's widgets)
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
 
         # --- set window/icon before showing ------------------------------
-        self.setWindowIcon(QIcon(str(icon_path())))  # <── icon here
+        self.setWindowIcon(_window_icon())  # <── icon here
 
         # --- resize main window ---------------------------------------------
         self.resize(*self._DEFAULT_SIZE)
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.optimize import curve_fit
 
 
 class TemperatureFitter:
@@ -21,12 +20,81 @@ class TemperatureFitter:
     _c1 = 3.7418e-16  # W·m^2
     _c2 = 0.014388  # m·K
 
+    # Largest exponent passed to exp(); exp(700) is still finite in float64
+    _MAX_EXPONENT = 700.0
+
+    # The fit runs on (T / _T_SCALE, ln S) so both parameters are O(1)
+    _T_SCALE = 1000.0
+
+    @staticmethod
+    def _planck(wl_m, T, S, out=None):
+        """Black‑body spectral radiance vs wavelength (m).
+
+        If *out* is given (float array shaped like *wl_m*), the result is
+        written into it and returned, so callers can reuse a buffer.
+        """
+        wl = np.asarray(wl_m, dtype=float)
+        # Evaluate in place on one work buffer instead of allocating a
+        # temporary for every intermediate (exponent, exp, λ^5, quotient).
+        if out is None:
+            out = np.empty_like(wl)
+        np.multiply(wl, T, out=out)
+        np.divide(TemperatureFitter._c2, out, out=out)
+        # Clip the exponent where exp() would overflow float64: the result is
+        # ~0 there anyway, and no inf / overflow warning is ever produced.
+        np.minimum(out, TemperatureFitter._MAX_EXPONENT, out=out)
+        # expm1 fuses the "- 1" (one pass less) and stays accurate for small
+        # exponents (Rayleigh–Jeans side); in the Wien regime it equals exp()
+        np.expm1(out, out=out)
+        # λ^5 as λ·λ²·λ² – plain multiplies instead of a libm pow() per element
+        wl2 = wl * wl
+        out *= wl
+        out *= wl2
+        out *= wl2
+        np.divide(S * TemperatureFitter._c1, out, out=out)
+        return out
+
     @staticmethod
-    def _planck(wl_m, T, S):
-        """Black‑body spectral radiance vs wavelength (m)."""
-        # avoid division by zero
-        exponent = TemperatureFitter._c2 / (wl_m * T)
-        return S * (TemperatureFitter._c1 / wl_m ** 5) / (np.exp(exponent) - 1)
+    def _planck_model(wl_m):
+        """Return ``model(wl_m, T, S)`` and its Jacobian on a fixed grid.
+
+        Everything that depends only on λ – c2/λ and c1/λ^5 – is computed
+        once here, so each of the many evaluations during the fit is just
+        expm1, one divide and one scale.  *jac* is the analytic Jacobian
+        (∂I/∂T, ∂I/∂S), which spares the solver finite-difference calls.
+        """
+        wl = np.asarray(wl_m, dtype=float)
+        wl2 = wl * wl
+        c2_over_wl = TemperatureFitter._c2 / wl
+        c1_over_wl5 = TemperatureFitter._c1 / (wl * wl2 * wl2)
+
+        def core(T):
+            # x = c2/(λT) (clipped as in _planck) and I/S = c1/λ^5 / (e^x - 1)
+            x = np.divide(c2_over_wl, T)
+            np.minimum(x, TemperatureFitter._MAX_EXPONENT, out=x)
+            i_over_s = np.expm1(x)
+            np.divide(c1_over_wl5, i_over_s, out=i_over_s)
+            return x, i_over_s
+
+        def model(_, T, S):
+            _, i_over_s = core(T)
+            i_over_s *= S
+            return i_over_s
+
+        def jac(_, T, S):
+            x, i_over_s = core(T)
+            J = np.empty((x.size, 2))
+            # ∂I/∂S = I/S
+            J[:, 1] = i_over_s
+            # ∂I/∂T = I · (x/T) · e^x/(e^x - 1),  e^x/(e^x - 1) = 1 + (I/S)/(c1/λ^5)
+            np.divide(i_over_s, c1_over_wl5, out=J[:, 0])
+            J[:, 0] += 1.0
+            J[:, 0] *= x
+            J[:, 0] *= i_over_s
+            J[:, 0] *= S / T
+            return J
+
+        return model, jac
 
     def __init__(self, p0=(2000, 1e-11)):
         """t
@@ -42,11 +110,12 @@ class TemperatureFitter:
         self.T_err = None
         self.S = None
         self.S_err = None
+        self.model = None
 
     def fit(self, wavelengths_nm: np.ndarray, counts: np.ndarray,
             yerr: np.ndarray | None = None):
         """
-        Fit the input spectrum and (optionally) plot data+fit.
+        Fit the input spectrum to the Planck model.
 
         Parameters
         ----------
@@ -54,49 +123,97 @@ class TemperatureFitter:
             Wavelengths in nanometers.
         counts : array-like
             Measured (fully corrected) counts.
-        plot : bool
-            If True, produces a matplotlib plot of data and fit.
+        yerr : array-like, optional
+            1σ uncertainties of *counts*; if given, they weight the fit and
+            the goodness of fit is the reduced χ² instead of R².
 
         Returns
         -------
         T_fit, T_err : tuple of floats
             Best‑fit black‑body temperature (K) and its 1σ uncertainty.
         """
+        # SciPy is only needed once a spectrum is fitted; importing it here
+        # keeps it off the GUI's startup path
+        from scipy.optimize import least_squares
+
         # Convert wavelengths to meters
         wl_m = wavelengths_nm * 1e-9
 
-        sigma = yerr if yerr is not None else None
-
-        popt, pcov = curve_fit(
-            self._planck,
-            wl_m,
-            counts,
-            p0=self._p0,
-            sigma=sigma,
-            absolute_sigma=(yerr is not None),
-            maxfev=100000
-        )
-
-        T_fit, S_fit = popt
-        perr = np.sqrt(np.diag(pcov))
-        T_err, S_err = perr
-
-        # Store
+        counts = np.asarray(counts, dtype=float)
+        weight = 1.0 / np.asarray(yerr, dtype=float) if yerr is not None else None
+        model_fn, jac_fn = self._planck_model(wl_m)
+
+        # Solve in p = (T / _T_SCALE, ln S): S spans many decades (~1e-11),
+        # which the solver handles far better as an O(1) log, and stays > 0
+        def to_physical(p):
+            # (trial steps can overshoot ln S; keep exp() finite)
+            return p[0] * self._T_SCALE, np.exp(min(p[1], self._MAX_EXPONENT))
+
+        def residuals(p):
+            r = model_fn(wl_m, *to_physical(p))
+            r -= counts
+            if weight is not None:
+                r *= weight
+            return r
+
+        def jacobian(p):
+            T, S = to_physical(p)
+            J = jac_fn(wl_m, T, S)
+            J[:, 0] *= self._T_SCALE    # ∂I/∂p0 = ∂I/∂T · dT/dp0
+            J[:, 1] *= S                # ∂I/∂p1 = ∂I/∂S · S
+            if weight is not None:
+                J *= weight[:, None]
+            return J
+
+        T0, S0 = self._p0
+        # A far-off trial step in ln S can overflow the model to inf; that
+        # step is simply rejected by the solver, so don't warn about it
+        with np.errstate(over="ignore"):
+            result = least_squares(
+                residuals,
+                x0=(T0 / self._T_SCALE, np.log(S0)),
+                jac=jacobian,
+                method="lm",
+                x_scale="jac",
+                max_nfev=100000,
+            )
+        if not result.success:
+            raise RuntimeError("Optimal parameters not found: " + result.message)
+
+        popt = result.x
+        T_fit, S_fit = to_physical(popt)
+
+        # Covariance of p as curve_fit computes it (pseudo-inverse of JᵀJ,
+        # scaled by the residual variance unless yerr is absolute) ...
+        _, sv, VT = np.linalg.svd(result.jac, full_matrices=False)
+        keep = sv > np.finfo(float).eps * max(result.jac.shape) * sv[0]
+        sv, VT = sv[keep], VT[keep]
+        pcov = (VT.T / sv ** 2) @ VT
+        dof = counts.size - popt.size
+        if yerr is None:
+            pcov *= 2.0 * result.cost / dof if dof > 0 else np.inf
+        # ... mapped back to (T, S) with dT/dp0 = _T_SCALE and dS/dp1 = S
+        T_err, S_err = np.sqrt(np.diag(pcov)) * (self._T_SCALE, S_fit)
+
+        # Store (the model curve at the optimum is kept for callers that
+        # plot or export it)
         self.T, self.T_err = T_fit, T_err
         self.S, self.S_err = S_fit, S_err
+        self.model = model_fn(wl_m, T_fit, S_fit)
 
         # --- Goodness of fit ---
-        model = self._planck(wl_m, T_fit, S_fit)
-        resid = counts - model
+        # The solver's cost is ½·Σ r² of the (weighted) residuals at the
+        # optimum, i.e. half of χ² or of SS_res – no further pass needed
+        sum_sq = 2.0 * result.cost
 
         if yerr is not None:
-            chi2 = np.sum((resid / yerr) ** 2)
-            dof = counts.size - len(popt)
+            chi2 = sum_sq
             gof_value = chi2 / dof
             gof_label = r'$\chi^2_\nu$'
         else:
-            ss_res = np.sum(resid ** 2)
-            ss_tot = np.sum((counts - np.mean(counts)) ** 2)
+            ss_res = sum_sq
+            dev = counts - counts.mean()
+            ss_tot = dev @ dev
             gof_value = 1 - ss_res / ss_tot
             gof_label = r'$R^2$'
 
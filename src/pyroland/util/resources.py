@@ -6,13 +6,19 @@ Example
 from pyroland.util.resources import data_path
 csv = data_path("camera_quantum_efficiency.csv")
 """
+from functools import lru_cache
 from importlib.resources import files
 from pathlib import Path
 
 _DATA_PACKAGE = "pyroland.corrections.data"
 _ICON_PACKAGE = "pyroland.icons"
 
+# Package roots, resolved once through the (possibly frozen) importer
+_DATA_ROOT = files(_DATA_PACKAGE)
+_ICON_ROOT = files(_ICON_PACKAGE)
 
+
+@lru_cache(maxsize=128)
 def data_path(filename: str) -> Path:
     """
     Return a *Path* to a data file located in ``pyroland/corrections/data``.
@@ -20,7 +26,8 @@ def data_path(filename: str) -> Path:
     Works transparently whether the package lives on the filesystem,
     inside a wheel, or extracted by PyInstaller.
     """
-    return files(_DATA_PACKAGE).joinpath(filename)
+    return _DATA_ROOT.joinpath(filename)
 
+@lru_cache(maxsize=128)
 def icon_path(name: str = "app.ico") -> Path:
-    return files(_ICON_PACKAGE).joinpath(name)
+    return _ICON_ROOT.joinpath(name)